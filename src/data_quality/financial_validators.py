@@ -22,15 +22,27 @@ class FinancialValidators:
     Financial services specific data validators
     """
     
+    # UK financial validation patterns (compiled once for all instances)
+    _UK_SORT_CODE_RE = re.compile(r'^\d{2}-\d{2}-\d{2}$')
+    _UK_ACCOUNT_NUMBER_RE = re.compile(r'^\d{8}$')
+    _IBAN_RE = re.compile(r'^[A-Z]{2}\d{2}[A-Z0-9]{4}\d{7}([A-Z0-9]?){0,16}$')
+    _SWIFT_BIC_RE = re.compile(r'^[A-Z]{6}[A-Z0-9]{2}([A-Z0-9]{3})?$')
+    
+    # Common currency codes for UK financial services
+    _VALID_CURRENCIES = frozenset({
+        'GBP', 'USD', 'EUR', 'JPY', 'CHF', 'CAD', 'AUD', 'NZD',
+        'SEK', 'NOK', 'DKK', 'PLN', 'CZK', 'HUF', 'SGD', 'HKD'
+    })
+    
     def __init__(self, audit_manager: Optional[AuditManager] = None):
         self.audit_manager = audit_manager
         self.logger = logging.getLogger(__name__)
         
         # UK financial validation patterns
-        self.uk_sort_code_pattern = re.compile(r'^\d{2}-\d{2}-\d{2}$')
-        self.uk_account_number_pattern = re.compile(r'^\d{8}$')
-        self.iban_pattern = re.compile(r'^[A-Z]{2}\d{2}[A-Z0-9]{4}\d{7}([A-Z0-9]?){0,16}$')
-        self.swift_bic_pattern = re.compile(r'^[A-Z]{6}[A-Z0-9]{2}([A-Z0-9]{3})?$')
+        self.uk_sort_code_pattern = self._UK_SORT_CODE_RE
+        self.uk_account_number_pattern = self._UK_ACCOUNT_NUMBER_RE
+        self.iban_pattern = self._IBAN_RE
+        self.swift_bic_pattern = self._SWIFT_BIC_RE
         
         # Financial amount validation
         self.max_transaction_amount = Decimal('1000000.00')  # £1M limit
@@ -47,9 +59,9 @@ class FinancialValidators:
         Returns:
             True if valid, False otherwise
         """
-        if not isinstance(sort_code, str):
+        if not isinstance(sort_code, str) or '-' not in sort_code:
             return False
-        return bool(re.match(r'^\d{2}-\d{2}-\d{2}$', sort_code))
+        return bool(FinancialValidators._UK_SORT_CODE_RE.match(sort_code))
     
     @staticmethod
     def validate_uk_account_number(account_number: str) -> bool:
@@ -64,7 +76,7 @@ class FinancialValidators:
         """
         if not isinstance(account_number, str):
             return False
-        return bool(re.match(r'^\d{8}$', account_number))
+        return bool(FinancialValidators._UK_ACCOUNT_NUMBER_RE.match(account_number))
     
     @staticmethod
     def validate_iban(iban: str) -> bool:
@@ -84,7 +96,7 @@ class FinancialValidators:
         iban = iban.replace(' ', '').upper()
         
         # Check format
-        if not re.match(r'^[A-Z]{2}\d{2}[A-Z0-9]{4}\d{7}([A-Z0-9]?){0,16}$', iban):
+        if not FinancialValidators._IBAN_RE.match(iban):
             return False
         
         # IBAN checksum validation (simplified)
@@ -118,7 +130,7 @@ class FinancialValidators:
         """
         if not isinstance(swift_bic, str):
             return False
-        return bool(re.match(r'^[A-Z]{6}[A-Z0-9]{2}([A-Z0-9]{3})?$', swift_bic.upper()))
+        return bool(FinancialValidators._SWIFT_BIC_RE.match(swift_bic.upper()))
     
     @staticmethod
     def validate_financial_amount(amount: Any, min_amount: float = 0.01, max_amount: float = 1000000.00) -> bool:
@@ -150,16 +162,10 @@ class FinancialValidators:
         Returns:
             True if valid, False otherwise
         """
-        # Common currency codes for UK financial services
-        valid_currencies = {
-            'GBP', 'USD', 'EUR', 'JPY', 'CHF', 'CAD', 'AUD', 'NZD',
-            'SEK', 'NOK', 'DKK', 'PLN', 'CZK', 'HUF', 'SGD', 'HKD'
-        }
-        
         if not isinstance(currency_code, str):
             return False
         
-        return currency_code.upper() in valid_currencies
+        return currency_code.upper() in FinancialValidators._VALID_CURRENCIES
     
     @staticmethod
     def validate_transaction_date(transaction_date: Any) -> bool:
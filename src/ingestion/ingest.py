@@ -205,7 +205,7 @@ class DataIngester:
         
         # Save as Parquet
         output_file = partition_path / f"{source_name}_{current_date.strftime('%Y%m%d_%H%M%S')}.parquet"
-        df.to_parquet(output_file, index=False)
+        df.to_parquet(output_file, engine='pyarrow', index=False)
         
         # Save metadata
         metadata_file = partition_path / f"{source_name}_{current_date.strftime('%Y%m%d_%H%M%S')}_metadata.json"
@@ -3,129 +3,213 @@
 import os
 import yaml
 import re
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from pydantic import Field
-from pydantic_settings import BaseSettings
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple, Type
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.fields import FieldInfo
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
-class DatabaseConfig(BaseSettings):
+# Static compliance rules per regulatory level (read-only, shared across calls)
+_FCA_RULES = MappingProxyType({
+    'allowed_classifications': ('PUBLIC', 'INTERNAL', 'CONFIDENTIAL', 'RESTRICTED'),
+    'allowed_actions': ('READ', 'write', 'validate', 'transform', 'audit')
+})
+_GDPR_RULES = MappingProxyType({
+    'allowed_classifications': ('PUBLIC', 'INTERNAL'),
+    'allowed_actions': ('read', 'validate', 'anonymize')
+})
+_SOX_RULES = MappingProxyType({
+    'allowed_classifications': ('PUBLIC', 'INTERNAL', 'CONFIDENTIAL'),
+    'allowed_actions': ('read', 'validate', 'audit')
+})
+
+
+class _SettingsSection(BaseModel):
+    """Config section whose field aliases are the flat environment variable names.
+    
+    Sections are frozen so derived values cached on first access cannot go stale.
+    """
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
+
+
+class PipelineConfig(_SettingsSection):
+    """Pipeline runtime configuration."""
+    environment: str = Field(default="development", validation_alias="ENVIRONMENT")
+    pipeline_name: str = Field(default="coventry-dw-pipeline", validation_alias="PIPELINE_NAME")
+    log_level: str = Field(default="INFO", validation_alias="LOG_LEVEL")
+
+
+class DatabaseConfig(_SettingsSection):
     """Database configuration."""
-    host: str = Field(default="localhost", env="DB_HOST")
-    port: int = Field(default=5432, env="DB_PORT")
-    name: str = Field(default="coventry_dw", env="DB_NAME")
-    user: str = Field(default="postgres", env="DB_USER")
-    password: str = Field(default="", env="DB_PASSWORD")
+    host: str = Field(default="localhost", validation_alias="DB_HOST")
+    port: int = Field(default=5432, validation_alias="DB_PORT")
+    name: str = Field(default="coventry_dw", validation_alias="DB_NAME")
+    user: str = Field(default="postgres", validation_alias="DB_USER")
+    password: str = Field(default="", validation_alias="DB_PASSWORD")
     
     @property
     def connection_string(self) -> str:
         return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
 
 
-class AWSConfig(BaseSettings):
+class AWSConfig(_SettingsSection):
     """AWS configuration."""
-    access_key_id: str = Field(default="", env="AWS_ACCESS_KEY_ID")
-    secret_access_key: str = Field(default="", env="AWS_SECRET_ACCESS_KEY")
-    region: str = Field(default="eu-west-2", env="AWS_DEFAULT_REGION")
-    s3_bucket: str = Field(default="coventry-data-lake", env="S3_BUCKET_NAME")
+    access_key_id: str = Field(default="", validation_alias="AWS_ACCESS_KEY_ID")
+    secret_access_key: str = Field(default="", validation_alias="AWS_SECRET_ACCESS_KEY")
+    region: str = Field(default="eu-west-2", validation_alias="AWS_DEFAULT_REGION")
+    s3_bucket: str = Field(default="coventry-data-lake", validation_alias="S3_BUCKET_NAME")
 
 
-class StorageConfig(BaseSettings):
+class StorageConfig(_SettingsSection):
     """Storage configuration."""
-    data_root_path: str = Field(default="data", env="DATA_ROOT_PATH")
-    output_root_path: str = Field(default="output", env="OUTPUT_ROOT_PATH")
-    bronze_path: str = Field(default="output/bronze", env="BRONZE_PATH")
-    silver_path: str = Field(default="output/silver", env="SILVER_PATH")
-    gold_path: str = Field(default="output/gold", env="GOLD_PATH")
-    quarantine_path: str = Field(default="output/quarantine", env="QUARANTINE_PATH")
-    schema_path: str = Field(default="schemas", env="SCHEMA_PATH")
-    logs_path: str = Field(default="logs", env="LOGS_PATH")
-    storage_format: str = Field(default="parquet", env="STORAGE_FORMAT")
-    partition_columns: str = Field(default="year,month", env="PARTITION_COLUMNS")
-    compression: str = Field(default="snappy", env="COMPRESSION")
+    data_root_path: str = Field(default="data", validation_alias="DATA_ROOT_PATH")
+    output_root_path: str = Field(default="output", validation_alias="OUTPUT_ROOT_PATH")
+    bronze_path: str = Field(default="output/bronze", validation_alias="BRONZE_PATH")
+    silver_path: str = Field(default="output/silver", validation_alias="SILVER_PATH")
+    gold_path: str = Field(default="output/gold", validation_alias="GOLD_PATH")
+    quarantine_path: str = Field(default="output/quarantine", validation_alias="QUARANTINE_PATH")
+    schema_path: str = Field(default="schemas", validation_alias="SCHEMA_PATH")
+    logs_path: str = Field(default="logs", validation_alias="LOGS_PATH")
+    storage_format: str = Field(default="parquet", validation_alias="STORAGE_FORMAT")
+    partition_columns: str = Field(default="year,month", validation_alias="PARTITION_COLUMNS")
+    compression: str = Field(default="snappy", validation_alias="COMPRESSION")
     
-    @property
-    def partition_cols_list(self) -> list:
-        """Get partition columns as a list."""
-        return [col.strip() for col in self.partition_columns.split(",") if col.strip()]
+    @cached_property
+    def partition_cols_list(self) -> Tuple[str, ...]:
+        """Get partition columns as a tuple."""
+        return tuple(col for col in (c.strip() for c in self.partition_columns.split(",")) if col)
 
 
-class DataQualityConfig(BaseSettings):
+class DataQualityConfig(_SettingsSection):
     """Data quality configuration."""
-    threshold: float = Field(default=0.95, env="DATA_QUALITY_THRESHOLD")
-    schema_validation_strict: bool = Field(default=True, env="SCHEMA_VALIDATION_STRICT")
-    fail_on_error: bool = Field(default=False, env="FAIL_ON_DATA_QUALITY_ERROR")
-    coverage_threshold: float = Field(default=0.95, env="COVERAGE_THRESHOLD")
+    threshold: float = Field(default=0.95, validation_alias="DATA_QUALITY_THRESHOLD")
+    schema_validation_strict: bool = Field(default=True, validation_alias="SCHEMA_VALIDATION_STRICT")
+    fail_on_error: bool = Field(default=False, validation_alias="FAIL_ON_DATA_QUALITY_ERROR")
+    coverage_threshold: float = Field(default=0.95, validation_alias="COVERAGE_THRESHOLD")
 
 
-class RetryConfig(BaseSettings):
+class RetryConfig(_SettingsSection):
     """Retry configuration."""
-    max_retries: int = Field(default=3, env="MAX_RETRIES")
-    retry_delay: int = Field(default=5, env="RETRY_DELAY")
-    backoff_factor: float = Field(default=2.0, env="RETRY_BACKOFF_FACTOR")
+    max_retries: int = Field(default=3, validation_alias="MAX_RETRIES")
+    retry_delay: int = Field(default=5, validation_alias="RETRY_DELAY")
+    backoff_factor: float = Field(default=2.0, validation_alias="RETRY_BACKOFF_FACTOR")
 
 
-class PerformanceConfig(BaseSettings):
+class PerformanceConfig(_SettingsSection):
     """Performance configuration."""
-    max_workers: int = Field(default=4, env="MAX_WORKERS")
-    chunk_size: int = Field(default=10000, env="CHUNK_SIZE")
-    memory_limit_mb: int = Field(default=2048, env="MEMORY_LIMIT_MB")
+    max_workers: int = Field(default=4, validation_alias="MAX_WORKERS")
+    chunk_size: int = Field(default=10000, validation_alias="CHUNK_SIZE")
+    memory_limit_mb: int = Field(default=2048, validation_alias="MEMORY_LIMIT_MB")
 
 
-class ComplianceConfig(BaseSettings):
+class ComplianceConfig(_SettingsSection):
     """Financial services compliance configuration."""
-    enabled_levels: str = Field(default="FCA_RULES,GDPR,SOX", env="COMPLIANCE_LEVELS")
-    audit_retention_days: int = Field(default=2555, env="AUDIT_RETENTION_DAYS")  # 7 years
-    data_retention_days: int = Field(default=2555, env="DATA_RETENTION_DAYS")
-    encryption_enabled: bool = Field(default=True, env="ENCRYPTION_ENABLED")
-    pii_detection_enabled: bool = Field(default=True, env="PII_DETECTION_ENABLED")
-    suspicious_transaction_threshold: float = Field(default=10000.0, env="SUSPICIOUS_THRESHOLD")
-    max_transaction_amount: float = Field(default=1000000.0, env="MAX_TRANSACTION_AMOUNT")
+    enabled_levels: str = Field(default="FCA_RULES,GDPR,SOX", validation_alias="COMPLIANCE_LEVELS")
+    audit_retention_days: int = Field(default=2555, validation_alias="AUDIT_RETENTION_DAYS")  # 7 years
+    data_retention_days: int = Field(default=2555, validation_alias="DATA_RETENTION_DAYS")
+    encryption_enabled: bool = Field(default=True, validation_alias="ENCRYPTION_ENABLED")
+    pii_detection_enabled: bool = Field(default=True, validation_alias="PII_DETECTION_ENABLED")
+    suspicious_transaction_threshold: float = Field(default=10000.0, validation_alias="SUSPICIOUS_THRESHOLD")
+    max_transaction_amount: float = Field(default=1000000.0, validation_alias="MAX_TRANSACTION_AMOUNT")
     
-    @property
-    def enabled_levels_list(self) -> List[str]:
-        return [level.strip() for level in self.enabled_levels.split(',')]
+    @cached_property
+    def enabled_levels_list(self) -> Tuple[str, ...]:
+        return tuple(level for level in (lvl.strip() for lvl in self.enabled_levels.split(',')) if level)
 
 
-class MonitoringConfig(BaseSettings):
+class MonitoringConfig(_SettingsSection):
     """Monitoring and alerting configuration."""
-    enable_metrics: bool = Field(default=True, env="ENABLE_METRICS")
-    metrics_retention_days: int = Field(default=90, env="METRICS_RETENTION_DAYS")
-    alert_email: str = Field(default="", env="ALERT_EMAIL")
-    alert_slack_webhook: str = Field(default="", env="ALERT_SLACK_WEBHOOK")
-    performance_threshold_seconds: int = Field(default=300, env="PERFORMANCE_THRESHOLD")
-    data_quality_threshold: float = Field(default=0.95, env="DATA_QUALITY_THRESHOLD")
-    suspicious_rate_threshold: float = Field(default=0.05, env="SUSPICIOUS_RATE_THRESHOLD")
-    max_transaction_volume: int = Field(default=100000, env="MAX_TRANSACTION_VOLUME")
+    enable_metrics: bool = Field(default=True, validation_alias="ENABLE_METRICS")
+    metrics_retention_days: int = Field(default=90, validation_alias="METRICS_RETENTION_DAYS")
+    alert_email: str = Field(default="", validation_alias="ALERT_EMAIL")
+    alert_slack_webhook: str = Field(default="", validation_alias="ALERT_SLACK_WEBHOOK")
+    performance_threshold_seconds: int = Field(default=300, validation_alias="PERFORMANCE_THRESHOLD")
+    data_quality_threshold: float = Field(default=0.95, validation_alias="DATA_QUALITY_THRESHOLD")
+    suspicious_rate_threshold: float = Field(default=0.05, validation_alias="SUSPICIOUS_RATE_THRESHOLD")
+    max_transaction_volume: int = Field(default=100000, validation_alias="MAX_TRANSACTION_VOLUME")
 
 
-class SecurityConfig(BaseSettings):
+class SecurityConfig(_SettingsSection):
     """Security configuration."""
-    encryption_key: str = Field(default="", env="ENCRYPTION_KEY")
-    jwt_secret: str = Field(default="", env="JWT_SECRET")
-    api_key: str = Field(default="", env="API_KEY")
-    enable_audit_logging: bool = Field(default=True, env="ENABLE_AUDIT_LOGGING")
-    require_ssl: bool = Field(default=True, env="REQUIRE_SSL")
-    session_timeout_minutes: int = Field(default=30, env="SESSION_TIMEOUT")
-    max_login_attempts: int = Field(default=3, env="MAX_LOGIN_ATTEMPTS")
+    encryption_key: str = Field(default="", validation_alias="ENCRYPTION_KEY")
+    jwt_secret: str = Field(default="", validation_alias="JWT_SECRET")
+    api_key: str = Field(default="", validation_alias="API_KEY")
+    enable_audit_logging: bool = Field(default=True, validation_alias="ENABLE_AUDIT_LOGGING")
+    require_ssl: bool = Field(default=True, validation_alias="REQUIRE_SSL")
+    session_timeout_minutes: int = Field(default=30, validation_alias="SESSION_TIMEOUT")
+    max_login_attempts: int = Field(default=3, validation_alias="MAX_LOGIN_ATTEMPTS")
+
+
+class _FlatEnvSettingsSource(PydanticBaseSettingsSource):
+    """Populate nested config sections from flat env names (e.g. DB_HOST) in one pass."""
+    
+    def get_field_value(self, field: FieldInfo, field_name: str) -> Tuple[Any, str, bool]:
+        return None, field_name, False
+    
+    def __call__(self) -> Dict[str, Any]:
+        env = os.environ
+        data = {}
+        for section_name, section_field in self.settings_cls.model_fields.items():
+            section = {}
+            for field in section_field.annotation.model_fields.values():
+                if field.validation_alias in env:
+                    section[field.validation_alias] = env[field.validation_alias]
+            if section:
+                data[section_name] = section
+        return data
+
+
+class AppSettings(BaseSettings):
+    """All configuration sections, loaded from the environment in a single scan."""
+    pipeline: PipelineConfig = Field(default_factory=PipelineConfig)
+    database: DatabaseConfig = Field(default_factory=DatabaseConfig)
+    aws: AWSConfig = Field(default_factory=AWSConfig)
+    storage: StorageConfig = Field(default_factory=StorageConfig)
+    data_quality: DataQualityConfig = Field(default_factory=DataQualityConfig)
+    retry: RetryConfig = Field(default_factory=RetryConfig)
+    performance: PerformanceConfig = Field(default_factory=PerformanceConfig)
+    compliance: ComplianceConfig = Field(default_factory=ComplianceConfig)
+    monitoring: MonitoringConfig = Field(default_factory=MonitoringConfig)
+    security: SecurityConfig = Field(default_factory=SecurityConfig)
+    
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        # .env is already loaded into os.environ by load_dotenv() above
+        return init_settings, _FlatEnvSettingsSource(settings_cls)
 
 
 class BaseConfig:
     """Base configuration combining all config sections."""
     def __init__(self):
-        self.database = DatabaseConfig()
-        self.aws = AWSConfig()
-        self.storage = StorageConfig()
-        self.data_quality = DataQualityConfig()
-        self.retry = RetryConfig()
-        self.performance = PerformanceConfig()
-        self.compliance = ComplianceConfig()
-        self.monitoring = MonitoringConfig()
-        self.security = SecurityConfig()
+        settings = AppSettings()
+        self.environment = settings.pipeline.environment
+        self.pipeline_name = settings.pipeline.pipeline_name
+        self.log_level = settings.pipeline.log_level
+        self.database = settings.database
+        self.aws = settings.aws
+        self.storage = settings.storage
+        self.data_quality = settings.data_quality
+        self.retry = settings.retry
+        self.performance = settings.performance
+        self.compliance = settings.compliance
+        self.monitoring = settings.monitoring
+        self.security = settings.security
 
 
 class ConfigManager:
@@ -142,24 +226,25 @@ class ConfigManager:
         if not config_file.exists():
             return {}
         
-        with open(config_file, 'r') as f:
-            content = f.read()
-            # Expand environment variables
+        content = config_file.read_text(encoding='utf-8')
+        # Expand environment variables only when the file references any
+        if '${' in content:
             content = self._expand_env_vars(content)
-            return yaml.safe_load(content)
+        return yaml.load(content, Loader=_YAML_LOADER)
     
     def _expand_env_vars(self, content: str) -> str:
         """Expand environment variables in YAML content."""
         # Pattern to match ${VAR_NAME:-default_value} or ${VAR_NAME}
         pattern = r'\$\{([^}]+)\}'
+        env = os.environ.get
         
         def replace_var(match):
             var_expr = match.group(1)
             if ':-' in var_expr:
                 var_name, default_value = var_expr.split(':-', 1)
-                return os.getenv(var_name.strip(), default_value.strip())
+                return env(var_name.strip(), default_value.strip())
             else:
-                return os.getenv(var_expr.strip(), '')
+                return env(var_expr.strip(), '')
         
         return re.sub(pattern, replace_var, content)
     
@@ -254,19 +339,10 @@ class ConfigManager:
             'max_transaction_amount': self.base_config.compliance.max_transaction_amount,
         }
         
-        # Create compliance rules for different levels
-        compliance_dict['FCA_RULES'] = {
-            'allowed_classifications': ['PUBLIC', 'INTERNAL', 'CONFIDENTIAL', 'RESTRICTED'],
-            'allowed_actions': ['READ', 'write', 'validate', 'transform', 'audit']
-        }
-        compliance_dict['GDPR'] = {
-            'allowed_classifications': ['PUBLIC', 'INTERNAL'],
-            'allowed_actions': ['read', 'validate', 'anonymize']
-        }
-        compliance_dict['SOX'] = {
-            'allowed_classifications': ['PUBLIC', 'INTERNAL', 'CONFIDENTIAL'],
-            'allowed_actions': ['read', 'validate', 'audit']
-        }
+        # Compliance rules for different levels
+        compliance_dict['FCA_RULES'] = _FCA_RULES
+        compliance_dict['GDPR'] = _GDPR_RULES
+        compliance_dict['SOX'] = _SOX_RULES
         
         # YAML config overrides environment config
         compliance_dict.update(yaml_compliance)
@@ -1,30 +1,63 @@
 """Structured logging utilities for the Coventry DW pipeline."""
 
-import json
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
-from datetime import datetime
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 import structlog
 from .config import config
 
 
+def _json_default(obj: Any) -> str:
+    """Encode values JSON cannot represent; dates use ISO 8601 like orjson."""
+    return obj.isoformat() if hasattr(obj, "isoformat") else str(obj)
+
+
+try:
+    import orjson
+
+    def _dumps(obj: Dict[str, Any]) -> str:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    import json
+
+    def _dumps(obj: Dict[str, Any]) -> str:
+        return json.dumps(obj, default=_json_default, separators=(",", ":"))
+
+
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Pipeline name and environment are fixed for the process lifetime,
+        # so encode them once and prepend the serialized prefix to each record
+        self._static_fields = {
+            "pipeline_name": config.base_config.pipeline_name,
+            "environment": config.base_config.environment
+        }
+        self._prefix = _dumps(self._static_fields)[:-1] + ","
+    
     def format(self, record: logging.LogRecord) -> str:
+        # Derive the UTC timestamp from record.created rather than building a datetime
+        created = record.created
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": (
+                f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(created))}"
+                f".{int(record.msecs):03d}Z"
+            ),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
             "module": record.module,
             "function": record.funcName,
-            "line": record.lineno,
-            "pipeline_name": config.base_config.pipeline_name,
-            "environment": config.base_config.environment
+            "line": record.lineno
         }
         
         # Add exception info if present
@@ -32,10 +65,80 @@ class JSONFormatter(logging.Formatter):
             log_entry["exception"] = self.formatException(record.exc_info)
         
         # Add extra fields
-        if hasattr(record, 'extra_fields'):
-            log_entry.update(record.extra_fields)
+        extra_fields = getattr(record, 'extra_fields', None)
+        if extra_fields:
+            if not self._static_fields.keys().isdisjoint(extra_fields):
+                # Extra fields override the static ones, so encode the full entry
+                return _dumps({**self._static_fields, **log_entry, **extra_fields})
+            log_entry.update(extra_fields)
+        
+        return self._prefix + _dumps(log_entry)[1:]
+
+
+# Shared formatter; records are encoded on the logging thread by the queue handler
+_JSON_FORMATTER = JSONFormatter()
+
+# Listener-side handlers write the pre-encoded JSON line as-is
+_PASSTHROUGH_FORMATTER = logging.Formatter("%(message)s")
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that encodes records to JSON before enqueueing them."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stdlib prepare formats on the calling thread and clears
+        # args/exc_info, so later mutation of logged values cannot leak in
+        record = super().prepare(record)
+        record.extra_fields = None
+        return record
+
+
+# Pipeline loggers enqueue encoded records; a single background listener owns
+# the console and file handlers and does the I/O
+_LOG_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_QUEUE_HANDLER = _RecordQueueHandler(_LOG_QUEUE)
+_QUEUE_HANDLER.setFormatter(_JSON_FORMATTER)
+_listener: Optional[logging.handlers.QueueListener] = None
+# Guards the first-use start so concurrent loggers create only one listener
+_LISTENER_LOCK = threading.Lock()
+
+
+def _create_file_handler(handler_config: Dict[str, Any]) -> logging.Handler:
+    """Create a rotating file handler from logging config."""
+    log_file = Path(handler_config['filename'])
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=handler_config.get('max_bytes', 10485760),
+        backupCount=handler_config.get('backup_count', 5)
+    )
+    file_handler.setFormatter(_PASSTHROUGH_FORMATTER)
+    return file_handler
+
+
+def _ensure_listener() -> None:
+    """Start the background log listener on first use."""
+    global _listener
+    with _LISTENER_LOCK:
+        if _listener is not None:
+            return
         
-        return json.dumps(log_entry, default=str)
+        # Console handler
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(_PASSTHROUGH_FORMATTER)
+        handlers = [console_handler]
+        
+        # File handlers
+        log_config = config.get_logging_config()
+        for handler_config in log_config.get('handlers', []):
+            if handler_config.get('type') == 'file':
+                handlers.append(_create_file_handler(handler_config))
+        
+        _listener = logging.handlers.QueueListener(_LOG_QUEUE, *handlers)
+        _listener.start()
+        # Drain queued records before interpreter shutdown
+        atexit.register(_listener.stop)
 
 
 class PipelineLogger:
@@ -46,57 +149,44 @@ class PipelineLogger:
         self.logger = self._setup_logger()
     
     def _setup_logger(self) -> logging.Logger:
-        """Setup structured logger with JSON formatting."""
+        """Setup structured logger that hands records to the background listener."""
         logger = logging.getLogger(self.name)
         logger.setLevel(getattr(logging, config.base_config.log_level.upper()))
         
         # Clear existing handlers
         logger.handlers.clear()
         
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(JSONFormatter())
-        logger.addHandler(console_handler)
-        
-        # File handler
-        log_config = config.get_logging_config()
-        for handler_config in log_config.get('handlers', []):
-            if handler_config.get('type') == 'file':
-                self._add_file_handler(logger, handler_config)
+        _ensure_listener()
+        logger.addHandler(_QUEUE_HANDLER)
         
         return logger
     
-    def _add_file_handler(self, logger: logging.Logger, handler_config: Dict[str, Any]):
-        """Add file handler to logger."""
-        log_file = Path(handler_config['filename'])
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file,
-            maxBytes=handler_config.get('max_bytes', 10485760),
-            backupCount=handler_config.get('backup_count', 5)
-        )
-        file_handler.setFormatter(JSONFormatter())
-        logger.addHandler(file_handler)
-    
     def info(self, message: str, **kwargs):
         """Log info message with extra fields."""
-        extra = {'extra_fields': kwargs} if kwargs else {}
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        extra = {'extra_fields': kwargs} if kwargs else None
         self.logger.info(message, extra=extra)
     
     def warning(self, message: str, **kwargs):
         """Log warning message with extra fields."""
-        extra = {'extra_fields': kwargs} if kwargs else {}
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+        extra = {'extra_fields': kwargs} if kwargs else None
         self.logger.warning(message, extra=extra)
     
     def error(self, message: str, **kwargs):
         """Log error message with extra fields."""
-        extra = {'extra_fields': kwargs} if kwargs else {}
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        extra = {'extra_fields': kwargs} if kwargs else None
         self.logger.error(message, extra=extra)
     
     def debug(self, message: str, **kwargs):
         """Log debug message with extra fields."""
-        extra = {'extra_fields': kwargs} if kwargs else {}
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        extra = {'extra_fields': kwargs} if kwargs else None
         self.logger.debug(message, extra=extra)
     
     def log_pipeline_start(self, pipeline_name: str, run_id: str):
@@ -153,6 +243,7 @@ class PipelineLogger:
         )
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> PipelineLogger:
-    """Get a pipeline logger instance."""
+    """Get a pipeline logger instance (one per name, set up on first use)."""
     return PipelineLogger(name)
@@ -1,17 +1,29 @@
 """Pytest configuration and fixtures for Coventry DW Pipeline tests."""
 
 import pytest
+import numpy as np
 import pandas as pd
-import tempfile
+import yaml
 import shutil
 from pathlib import Path
 from unittest.mock import Mock, patch
-import os
 import json
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as YamlLoader
+
 # Test data fixtures
-@pytest.fixture
+# Session-scoped fixtures share one instance across the whole run and must not
+# be mutated in place; take a copy (e.g. ``df.copy()``) before modifying.
+@pytest.fixture(scope="session")
 def sample_transactions_df():
     """Sample transactions DataFrame for testing."""
     return pd.DataFrame({
@@ -24,7 +36,7 @@ def sample_transactions_df():
         'balance_after': [3450.50, 3404.51, 3392.01, 1876.23]
     })
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_accounts_data():
     """Sample accounts data for testing."""
     return [
@@ -56,26 +68,56 @@ def sample_accounts_data():
         }
     ]
 
-@pytest.fixture
-def temp_directory():
-    """Create a temporary directory for test files."""
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir)
+@pytest.fixture(scope="session")
+def transactions_csv_df():
+    """Sample transactions CSV, parsed once per session."""
+    transactions_file = Path('data/transactions.csv')
+    if not transactions_file.is_file():
+        pytest.skip("Sample transactions CSV not available")
+    return pd.read_csv(
+        transactions_file,
+        engine='pyarrow',
+        parse_dates=['transaction_date'],
+        date_format='%Y-%m-%d',
+    )
+
+@pytest.fixture(scope="session")
+def accounts_json_data():
+    """Sample accounts JSON, loaded once per session."""
+    accounts_file = Path('data/accounts.json')
+    if not accounts_file.is_file():
+        pytest.skip("Sample accounts JSON not available")
+    with open(accounts_file, 'r') as f:
+        return json.load(f)
+
+@pytest.fixture(scope="session")
+def pipeline_config():
+    """Pipeline YAML config, parsed once per session."""
+    with open('config/pipeline_config.yaml', 'r') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+@pytest.fixture(scope="session")
+def sample_transactions_csv(tmp_path_factory, sample_transactions_df):
+    """Sample transactions written to CSV once per session; copy before use."""
+    csv_file = tmp_path_factory.mktemp("csv") / "transactions.csv"
+    sample_transactions_df.to_csv(csv_file, index=False)
+    return csv_file
 
 @pytest.fixture
-def test_csv_file(sample_transactions_df, temp_directory):
+def test_csv_file(sample_transactions_csv, tmp_path):
     """Create a temporary CSV file with sample data."""
-    csv_file = temp_directory / "test_transactions.csv"
-    sample_transactions_df.to_csv(csv_file, index=False)
+    csv_file = tmp_path / "test_transactions.csv"
+    shutil.copy(sample_transactions_csv, csv_file)
     return csv_file
 
 @pytest.fixture
-def test_json_file(sample_accounts_data, temp_directory):
+def test_json_file(sample_accounts_data, tmp_path):
     """Create a temporary JSON file with sample data."""
-    json_file = temp_directory / "test_accounts.json"
-    with open(json_file, 'w') as f:
-        json.dump(sample_accounts_data, f, indent=2)
+    json_file = tmp_path / "test_accounts.json"
+    if orjson is not None:
+        json_file.write_bytes(orjson.dumps(sample_accounts_data))
+    else:
+        json_file.write_text(json.dumps(sample_accounts_data))
     return json_file
 
 @pytest.fixture
@@ -121,7 +163,7 @@ def mock_logger():
         mock_get_logger.return_value = mock_logger_instance
         yield mock_logger_instance
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_schema_data():
     """Sample schema data for testing."""
     return {
@@ -158,7 +200,7 @@ def mock_database():
         yield mock_conn
 
 @pytest.fixture
-def test_environment_vars():
+def test_environment_vars(monkeypatch):
     """Set up test environment variables."""
     test_env = {
         'ENVIRONMENT': 'test',
@@ -170,22 +212,13 @@ def test_environment_vars():
         'LOG_LEVEL': 'DEBUG'
     }
     
-    # Store original values
-    original_env = {}
+    # monkeypatch restores the original values on teardown
     for key, value in test_env.items():
-        original_env[key] = os.environ.get(key)
-        os.environ[key] = value
+        monkeypatch.setenv(key, value)
     
     yield test_env
-    
-    # Restore original values
-    for key, original_value in original_env.items():
-        if original_value is None:
-            os.environ.pop(key, None)
-        else:
-            os.environ[key] = original_value
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pipeline_results():
     """Sample pipeline execution results for testing."""
     return {
@@ -229,7 +262,7 @@ def mock_s3_client():
         mock_boto3.return_value = mock_client
         yield mock_client
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_validation_results():
     """Sample data validation results for testing."""
     return {
@@ -262,91 +295,94 @@ def sample_validation_results():
 class TestDataGenerator:
     """Utility class for generating test data."""
     
-    @staticmethod
-    def generate_transactions(num_rows: int = 100) -> pd.DataFrame:
+    ACCOUNTS = np.array(['ACC001', 'ACC002', 'ACC003', 'ACC004', 'ACC005'])
+    DESCRIPTIONS = np.array([
+        'Salary Payment', 'Tesco Supermarket', 'Costa Coffee',
+        'Shell Petrol Station', 'ATM Withdrawal', 'Amazon Purchase',
+        'Netflix Subscription', 'Electricity Bill'
+    ])
+    TRANSACTION_TYPES = np.array(['CREDIT', 'DEBIT'])
+    ACCOUNT_TYPES = np.array(['CURRENT', 'SAVINGS', 'PREMIUM'])
+    STATUSES = np.array(['ACTIVE', 'INACTIVE', 'CLOSED'])
+    OVERDRAFT_LIMITS = np.array([0, 500, 1000, 2000, 5000])
+    
+    def __init__(self):
+        # One generator shared by every batch draw
+        self._rng = np.random.default_rng()
+    
+    def generate_transactions(self, num_rows: int = 100) -> pd.DataFrame:
         """Generate synthetic transaction data."""
-        import random
-        from datetime import datetime, timedelta
-        
-        accounts = ['ACC001', 'ACC002', 'ACC003', 'ACC004', 'ACC005']
-        descriptions = [
-            'Salary Payment', 'Tesco Supermarket', 'Costa Coffee',
-            'Shell Petrol Station', 'ATM Withdrawal', 'Amazon Purchase',
-            'Netflix Subscription', 'Electricity Bill'
-        ]
+        rng = self._rng
         
-        data = []
-        for i in range(num_rows):
-            data.append({
-                'account_id': random.choice(accounts),
-                'transaction_id': f'TXN{i+1:06d}',
-                'transaction_date': (datetime.now() - timedelta(days=random.randint(0, 30))).strftime('%Y-%m-%d'),
-                'amount': round(random.uniform(-500, 2000), 2),
-                'description': random.choice(descriptions),
-                'transaction_type': random.choice(['CREDIT', 'DEBIT']),
-                'balance_after': round(random.uniform(0, 10000), 2)
-            })
+        # Build each column as a whole array rather than row by row
+        transaction_ids = np.char.mod('TXN%06d', np.arange(1, num_rows + 1))
+        today = np.datetime64(datetime.now().date(), 'D')
+        transaction_dates = today - rng.integers(0, 31, size=num_rows).astype('timedelta64[D]')
         
-        return pd.DataFrame(data)
+        return pd.DataFrame({
+            'account_id': rng.choice(self.ACCOUNTS, size=num_rows),
+            'transaction_id': transaction_ids,
+            'transaction_date': transaction_dates.astype(str),
+            'amount': np.round(rng.uniform(-500, 2000, size=num_rows), 2),
+            'description': rng.choice(self.DESCRIPTIONS, size=num_rows),
+            'transaction_type': rng.choice(self.TRANSACTION_TYPES, size=num_rows),
+            'balance_after': np.round(rng.uniform(0, 10000, size=num_rows), 2)
+        }, copy=False)
     
-    @staticmethod
-    def generate_accounts(num_accounts: int = 10) -> list:
+    def generate_accounts(self, num_accounts: int = 10) -> list:
         """Generate synthetic account data."""
-        import random
+        rng = self._rng
         
-        account_types = ['CURRENT', 'SAVINGS', 'PREMIUM']
-        statuses = ['ACTIVE', 'INACTIVE', 'CLOSED']
+        # Build each attribute as a whole array, then convert to records once
+        numbers = np.arange(1, num_accounts + 1)
+        today = np.datetime64(datetime.now().date(), 'D')
+        opening_dates = today - rng.integers(365, 1826, size=num_accounts).astype('timedelta64[D]')
         
-        accounts = []
-        for i in range(num_accounts):
-            accounts.append({
-                'account_id': f'ACC{i+1:03d}',
-                'customer_id': f'CUST{i+1:03d}',
-                'account_type': random.choice(account_types),
-                'account_name': f'Account {i+1}',
-                'opening_date': (datetime.now() - timedelta(days=random.randint(365, 1825))).strftime('%Y-%m-%d'),
-                'current_balance': round(random.uniform(0, 50000), 2),
-                'overdraft_limit': random.choice([0, 500, 1000, 2000, 5000]),
-                'interest_rate': round(random.uniform(0.001, 0.05), 3),
-                'status': random.choice(statuses),
-                'branch_code': f'COV{random.randint(1, 5):03d}',
-                'sort_code': f'12-34-{random.randint(50, 99)}'
-            })
+        accounts = pd.DataFrame({
+            'account_id': np.char.mod('ACC%03d', numbers),
+            'customer_id': np.char.mod('CUST%03d', numbers),
+            'account_type': rng.choice(self.ACCOUNT_TYPES, size=num_accounts),
+            'account_name': np.char.mod('Account %d', numbers),
+            'opening_date': opening_dates.astype(str),
+            'current_balance': np.round(rng.uniform(0, 50000, size=num_accounts), 2),
+            'overdraft_limit': rng.choice(self.OVERDRAFT_LIMITS, size=num_accounts),
+            'interest_rate': np.round(rng.uniform(0.001, 0.05, size=num_accounts), 3),
+            'status': rng.choice(self.STATUSES, size=num_accounts),
+            'branch_code': np.char.mod('COV%03d', rng.integers(1, 6, size=num_accounts)),
+            'sort_code': np.char.mod('12-34-%d', rng.integers(50, 100, size=num_accounts))
+        }, copy=False)
         
-        return accounts
+        return accounts.to_dict(orient='records')
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_data_generator():
     """Test data generator fixture."""
     return TestDataGenerator()
 
+@pytest.fixture(scope="session", params=[100, 1_000], ids=lambda n: f"N={n}")
+def generated_transactions_df(request, test_data_generator):
+    """Pregenerated synthetic transactions, built once per size per session.
+    
+    Shared across tests: call ``.copy(deep=False)`` before adding or
+    replacing columns.
+    """
+    return test_data_generator.generate_transactions(request.param)
+
 # Pytest configuration
-def pytest_configure(config):
-    """Configure pytest with custom markers."""
-    config.addinivalue_line(
-        "markers", "unit: mark test as a unit test"
-    )
-    config.addinivalue_line(
-        "markers", "integration: mark test as an integration test"
-    )
-    config.addinivalue_line(
-        "markers", "slow: mark test as slow running"
-    )
-    config.addinivalue_line(
-        "markers", "database: mark test as requiring database"
-    )
+_DATABASE_FIXTURES = frozenset({"mock_database", "test_database"})
+
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers automatically."""
     for item in items:
-        # Add unit marker to tests in unit directory
-        if "unit" in str(item.fspath):
-            item.add_marker(pytest.mark.unit)
+        parts = set(item.path.parts)
         
-        # Add integration marker to tests in integration directory
-        if "integration" in str(item.fspath):
+        # Add unit/integration marker from the test directory
+        if "unit" in parts:
+            item.add_marker(pytest.mark.unit)
+        elif "integration" in parts:
             item.add_marker(pytest.mark.integration)
         
         # Add database marker to tests that use database fixtures
-        if "mock_database" in item.fixturenames or "test_database" in item.fixturenames:
+        if not _DATABASE_FIXTURES.isdisjoint(item.fixturenames):
             item.add_marker(pytest.mark.database)
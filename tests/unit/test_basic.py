@@ -3,22 +3,39 @@
 import pytest
 import pandas as pd
 import json
+import re
 from pathlib import Path
-import tempfile
-import shutil
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Account identifiers follow the ACC### pattern
+ACCOUNT_RE = re.compile(r'ACC\d{3}')
+
+# Keyword -> category lookup for the simplified categorization logic
+CATEGORY_MAP = {
+    'tesco': 'Grocery', 'sainsbury': 'Grocery', 'asda': 'Grocery',
+    'shell': 'Fuel', 'bp': 'Fuel', 'petrol': 'Fuel',
+    'netflix': 'Entertainment', 'spotify': 'Entertainment',
+    'atm': 'ATM',
+    'salary': 'Transfer', 'payment': 'Transfer'
+}
+CATEGORY_RE = re.compile('(' + '|'.join(CATEGORY_MAP) + ')', re.IGNORECASE)
+
 
 class TestBasicFunctionality:
     """Test basic pipeline functionality without complex dependencies."""
     
-    def test_sample_data_exists(self):
+    def test_sample_data_exists(self, transactions_csv_df, accounts_json_data):
         """Test that sample data files exist and are readable."""
         # Test transactions CSV
         transactions_file = Path('data/transactions.csv')
-        assert transactions_file.exists(), "Transactions CSV file should exist"
+        assert transactions_file.stat().st_size > 0, "Transactions CSV file should not be empty"
         
-        df = pd.read_csv(transactions_file)
+        df = transactions_csv_df
         assert len(df) > 0, "Transactions CSV should contain data"
         assert 'account_id' in df.columns, "Should have account_id column"
         assert 'amount' in df.columns, "Should have amount column"
@@ -26,18 +43,17 @@ class TestBasicFunctionality:
         
         # Test accounts JSON
         accounts_file = Path('data/accounts.json')
-        assert accounts_file.exists(), "Accounts JSON file should exist"
+        assert accounts_file.stat().st_size > 0, "Accounts JSON file should not be empty"
         
-        with open(accounts_file, 'r') as f:
-            accounts = json.load(f)
+        accounts = accounts_json_data
         
         assert len(accounts) > 0, "Accounts JSON should contain data"
         assert 'account_id' in accounts[0], "Should have account_id field"
         assert 'account_type' in accounts[0], "Should have account_type field"
     
-    def test_data_quality_basic(self):
+    def test_data_quality_basic(self, transactions_csv_df):
         """Test basic data quality checks."""
-        df = pd.read_csv('data/transactions.csv')
+        df = transactions_csv_df
         
         # Check for required columns
         required_columns = ['account_id', 'transaction_id', 'amount', 'transaction_date']
@@ -51,8 +67,8 @@ class TestBasicFunctionality:
         assert df['account_id'].notna().all(), "Account ID should not have null values"
         assert df['transaction_id'].notna().all(), "Transaction ID should not have null values"
         
-        # Check date format
-        df['transaction_date'] = pd.to_datetime(df['transaction_date'])
+        # Check date format (parsed at load time; unparseable values leave object dtype)
+        assert pd.api.types.is_datetime64_any_dtype(df['transaction_date']), "All dates should be parseable"
         assert df['transaction_date'].notna().all(), "All dates should be parseable"
     
     def test_transaction_categorization_logic(self):
@@ -77,92 +93,92 @@ class TestBasicFunctionality:
         
         # Simple categorization function for testing
         def categorize_transaction(description):
-            desc_lower = description.lower()
-            if any(word in desc_lower for word in ['tesco', 'sainsbury', 'asda']):
-                return 'Grocery'
-            elif any(word in desc_lower for word in ['shell', 'bp', 'petrol']):
-                return 'Fuel'
-            elif any(word in desc_lower for word in ['netflix', 'spotify']):
-                return 'Entertainment'
-            elif 'atm' in desc_lower:
-                return 'ATM'
-            elif any(word in desc_lower for word in ['salary', 'payment']):
-                return 'Transfer'
-            else:
-                return 'Other'
+            match = CATEGORY_RE.search(description)
+            return CATEGORY_MAP.get(match.group(1).lower(), 'Other') if match else 'Other'
         
         # Test categorization
         for description, expected in expected_categories.items():
             result = categorize_transaction(description)
             assert result == expected, f"Expected {expected} for {description}, got {result}"
+        
+        # Vectorized categorization gives the same result in a single pass
+        descriptions = pd.Series(test_descriptions + ["Costa Coffee"])
+        categories = (
+            descriptions.str.extract(CATEGORY_RE, expand=False)
+            .str.lower()
+            .map(CATEGORY_MAP)
+            .fillna('Other')
+        )
+        assert categories.tolist() == [expected_categories[d] for d in test_descriptions] + ['Other']
     
-    def test_data_aggregation_logic(self):
+    def test_data_aggregation_logic(self, transactions_csv_df):
         """Test data aggregation functionality."""
-        df = pd.read_csv('data/transactions.csv')
+        df = transactions_csv_df.copy(deep=False)
         
         # Test monthly aggregation
-        df['transaction_date'] = pd.to_datetime(df['transaction_date'])
         df['year_month'] = df['transaction_date'].dt.to_period('M')
         
-        monthly_agg = df.groupby(['account_id', 'year_month']).agg({
-            'amount': ['sum', 'count', 'mean']
-        }).round(2)
+        monthly_agg = df.groupby(['account_id', 'year_month']).agg(
+            total=('amount', 'sum'),
+            n=('amount', 'count'),
+            avg=('amount', 'mean')
+        )
         
         assert len(monthly_agg) > 0, "Should have monthly aggregations"
         
         # Test account-level aggregation
-        account_agg = df.groupby('account_id').agg({
-            'amount': ['sum', 'count', 'min', 'max']
-        }).round(2)
+        account_agg = df.groupby('account_id').agg(
+            total=('amount', 'sum'),
+            n=('amount', 'count'),
+            min_amount=('amount', 'min'),
+            max_amount=('amount', 'max')
+        )
         
         assert len(account_agg) > 0, "Should have account-level aggregations"
         
         # Verify aggregation makes sense
         total_transactions = len(df)
-        sum_by_account = account_agg[('amount', 'count')].sum()
+        sum_by_account = account_agg['n'].sum()
         assert sum_by_account == total_transactions, "Aggregation counts should match total"
     
-    def test_file_operations(self):
+    def test_file_operations(self, tmp_path):
         """Test file operations for pipeline."""
-        # Create temporary directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Test directory creation
-            bronze_path = temp_path / 'bronze'
-            silver_path = temp_path / 'silver' 
-            gold_path = temp_path / 'gold'
-            
-            for path in [bronze_path, silver_path, gold_path]:
-                path.mkdir(parents=True, exist_ok=True)
-                assert path.exists(), f"Directory {path} should be created"
-            
-            # Test file writing and reading
-            test_data = {'test': 'data', 'timestamp': datetime.now().isoformat()}
-            test_file = temp_path / 'test.json'
-            
+        # Test directory creation
+        bronze_path = tmp_path / 'bronze'
+        silver_path = tmp_path / 'silver' 
+        gold_path = tmp_path / 'gold'
+        
+        for path in [bronze_path, silver_path, gold_path]:
+            path.mkdir(parents=True, exist_ok=True)
+            assert path.exists(), f"Directory {path} should be created"
+        
+        # Test file writing and reading
+        test_data = {'test': 'data', 'timestamp': datetime.now().isoformat()}
+        test_file = tmp_path / 'test.json'
+        
+        if orjson is not None:
+            test_file.write_bytes(orjson.dumps(test_data))
+        else:
             with open(test_file, 'w') as f:
                 json.dump(test_data, f)
-            
-            assert test_file.exists(), "Test file should be created"
-            
-            with open(test_file, 'r') as f:
-                loaded_data = json.load(f)
-            
-            assert loaded_data['test'] == 'data', "Data should be preserved"
+        
+        assert test_file.exists(), "Test file should be created"
+        
+        with open(test_file, 'r') as f:
+            loaded_data = json.load(f)
+        
+        assert loaded_data['test'] == 'data', "Data should be preserved"
     
-    def test_configuration_structure(self):
+    def test_configuration_structure(self, pipeline_config):
         """Test configuration file structure."""
         config_file = Path('config/pipeline_config.yaml')
-        assert config_file.exists(), "Pipeline config file should exist"
+        assert config_file.is_file(), "Pipeline config file should exist"
         
         env_example = Path('.env.example')
-        assert env_example.exists(), "Environment example file should exist"
+        assert env_example.is_file(), "Environment example file should exist"
         
         # Test that config contains expected sections
-        import yaml
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        config = pipeline_config
         
         assert 'pipeline' in config, "Config should have pipeline section"
         assert 'environments' in config, "Config should have environments section"
@@ -246,32 +262,26 @@ class TestBasicFunctionality:
 class TestDataValidation:
     """Test data validation functionality."""
     
-    def test_data_completeness(self):
+    def test_data_completeness(self, transactions_csv_df):
         """Test data completeness validation."""
-        df = pd.read_csv('data/transactions.csv')
+        df = transactions_csv_df
         
         # Calculate completeness per column
-        completeness = {}
-        for column in df.columns:
-            non_null_count = df[column].notna().sum()
-            total_count = len(df)
-            completeness[column] = non_null_count / total_count if total_count > 0 else 0
+        completeness = df.notna().mean()
         
         # Critical columns should be 100% complete
         critical_columns = ['account_id', 'transaction_id', 'amount']
-        for col in critical_columns:
-            assert completeness[col] == 1.0, f"Critical column {col} should be 100% complete"
+        assert (completeness[critical_columns] == 1.0).all(), "Critical columns should be 100% complete"
         
         # Overall completeness should be high
-        overall_completeness = sum(completeness.values()) / len(completeness)
-        assert overall_completeness >= 0.9, "Overall completeness should be >= 90%"
+        assert completeness.mean() >= 0.9, "Overall completeness should be >= 90%"
     
-    def test_business_rules(self):
+    def test_business_rules(self, transactions_csv_df):
         """Test business rule validation."""
-        df = pd.read_csv('data/transactions.csv')
+        df = transactions_csv_df
         
         # Rule 1: Account IDs should follow pattern
-        account_pattern = df['account_id'].str.match(r'^ACC\d{3}$')
+        account_pattern = df['account_id'].str.fullmatch(ACCOUNT_RE)
         assert account_pattern.all(), "All account IDs should follow ACC### pattern"
         
         # Rule 2: Transaction IDs should be unique
@@ -282,7 +292,6 @@ class TestDataValidation:
         assert max_amount < 100000, "Transaction amounts should be reasonable"
         
         # Rule 4: Dates should be within reasonable range
-        df['transaction_date'] = pd.to_datetime(df['transaction_date'])
         min_date = df['transaction_date'].min()
         max_date = df['transaction_date'].max()
         
@@ -293,12 +302,5 @@ class TestDataValidation:
         assert max_date <= datetime.now(), "Dates should not be in future"
 
 
-# Pytest configuration for this test file
-def pytest_configure(config):
-    """Configure pytest markers for this test file."""
-    config.addinivalue_line("markers", "basic: basic functionality tests")
-    config.addinivalue_line("markers", "validation: data validation tests")
-
-
 # Mark all tests in TestBasicFunctionality as basic tests
 pytestmark = pytest.mark.basic
@@ -0,0 +1,57 @@
+"""Unit tests for the financial validators."""
+
+import pandas as pd
+import pytest
+
+from src.data_quality.financial_validators import FinancialValidators
+
+
+class TestFinancialValidators:
+    """Test cases for FinancialValidators."""
+    
+    @pytest.mark.parametrize("method,value,expected", [
+        ("validate_uk_sort_code", "12-34-56", True),
+        ("validate_uk_sort_code", "123456", False),
+        ("validate_uk_sort_code", "12-34-5a", False),
+        ("validate_uk_sort_code", None, False),
+        ("validate_uk_account_number", "12345678", True),
+        ("validate_uk_account_number", "1234567", False),
+        ("validate_iban", "GB82WEST12345698765432", True),
+        ("validate_iban", "gb82 west 1234 5698 7654 32", True),
+        ("validate_iban", "GB83WEST12345698765432", False),
+        ("validate_swift_bic", "ABCDGB2L", True),
+        ("validate_swift_bic", "ABCDGB2LXXX", True),
+        ("validate_swift_bic", "ABC1GB2L", False),
+        ("validate_currency_code", "GBP", True),
+        ("validate_currency_code", "gbp", True),
+        ("validate_currency_code", "XYZ", False),
+        ("validate_financial_amount", 100.50, True),
+        ("validate_financial_amount", 0, False),
+        ("validate_financial_amount", "not a number", False),
+    ])
+    def test_validator(self, method, value, expected):
+        """Test a single financial validation function."""
+        assert getattr(FinancialValidators, method)(value) is expected
+    
+    def test_instance_patterns_share_class_regexes(self):
+        """Test instance pattern attributes reuse the precompiled class regexes."""
+        validators = FinancialValidators()
+        
+        assert validators.uk_sort_code_pattern is FinancialValidators._UK_SORT_CODE_RE
+        assert validators.iban_pattern is FinancialValidators._IBAN_RE
+    
+    def test_suspicious_transactions_on_generated_data(self, generated_transactions_df):
+        """Test AML flagging over larger synthetic transaction sets."""
+        df = generated_transactions_df
+        
+        flagged = FinancialValidators().check_suspicious_transactions(df)
+        
+        # Flags go on a copy; the shared fixture is left untouched
+        assert 'suspicious_flags' not in df.columns
+        assert len(flagged) == len(df)
+        
+        # Generated amounts stay below the large-amount threshold, so only
+        # weekend transactions should be flagged
+        is_weekend = pd.to_datetime(df['transaction_date']).dt.dayofweek >= 5
+        expected = is_weekend.map({True: 'WEEKEND_TRANSACTION', False: None})
+        assert flagged['suspicious_flags'].tolist() == expected.tolist()
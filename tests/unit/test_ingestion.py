@@ -2,68 +2,99 @@
 
 import pytest
 import pandas as pd
+import pyarrow.parquet as pq
 import json
+import shutil
+from functools import lru_cache
 from unittest.mock import Mock, patch, mock_open
 from pathlib import Path
-import tempfile
+from tenacity import stop_after_attempt, wait_none
 
-# Defer import to avoid PySpark initialization during test collection
-DataIngester = None
-INGESTION_AVAILABLE = None
 
+# Defer import to avoid PySpark initialization during test collection
+@lru_cache(maxsize=1)
 def _get_data_ingester():
-    """Lazy import of DataIngester to avoid heavy initialization."""
-    global DataIngester, INGESTION_AVAILABLE
-    if INGESTION_AVAILABLE is None:
-        try:
-            from src.ingestion.ingest import DataIngester as DI
-            DataIngester = DI
-            INGESTION_AVAILABLE = True
-        except ImportError:
-            DataIngester = None
-            INGESTION_AVAILABLE = False
+    """Lazy import of DataIngester; returns None if it cannot be imported."""
+    try:
+        from src.ingestion.ingest import DataIngester
+    except ImportError:
+        return None
     return DataIngester
 
 
+def _single_attempt(ingester, method_name):
+    """Bind a retried ingester method so it runs once and raises its own error."""
+    method = getattr(type(ingester), method_name)
+    once = method.retry_with(stop=stop_after_attempt(1), reraise=True)
+    return lambda *args, **kwargs: once(ingester, *args, **kwargs)
+
+
+# Shared schema version returned by mocked schema managers; treat as read-only
+_SCHEMA_V1 = Mock(version="1.0.0")
+
+
+def _fresh_schema_mgr():
+    """Create a schema manager mock that reports ``_SCHEMA_V1``."""
+    mock_schema_instance = Mock()
+    mock_schema_instance.auto_detect_schema.return_value = _SCHEMA_V1
+    mock_schema_instance.save_schema.return_value = None
+    return mock_schema_instance
+
+
+@pytest.fixture
+def ingester(tmp_path):
+    """Create a DataIngester instance for testing."""
+    DataIngesterClass = _get_data_ingester()
+    if DataIngesterClass is None:
+        pytest.skip("DataIngester not available")
+        
+    with patch('src.ingestion.ingest.SchemaManager') as mock_schema, \
+         patch('src.ingestion.ingest.PipelineMonitor') as mock_monitor:
+        
+        # Setup lightweight mocks to avoid heavy initialization
+        mock_schema.return_value = Mock()
+        mock_monitor.return_value = Mock()
+        
+        ingester = DataIngesterClass()
+    
+    ingester._schema_manager = _fresh_schema_mgr()
+    ingester._storage_config = {
+        'bronze_path': str(tmp_path / 'bronze'),
+        'format': 'parquet'
+    }
+    return ingester
+
+
 class TestDataIngester:
     """Test cases for DataIngester class."""
     
     @pytest.fixture
-    def ingester(self, mock_config, mock_logger):
-        """Create a DataIngester instance for testing."""
-        DataIngesterClass = _get_data_ingester()
-        if not INGESTION_AVAILABLE:
-            pytest.skip("DataIngester not available")
-            
-        with patch('src.ingestion.ingest.SchemaManager') as mock_schema, \
-             patch('src.ingestion.ingest.PipelineMonitor') as mock_monitor, \
-             patch('src.ingestion.ingest.config') as mock_cfg:
-            
-            # Setup lightweight mocks to avoid heavy initialization
-            mock_schema.return_value = Mock()
-            mock_monitor.return_value = Mock()
-            mock_cfg.get_storage_config.return_value = {
-                'bronze_path': 'test_output/bronze',
-                'format': 'parquet'
-            }
-            
-            return DataIngesterClass()
+    def ingest_config(self):
+        """Patch the config object where the ingest module looks it up."""
+        with patch('src.ingestion.ingest.config') as mock_cfg:
+            yield mock_cfg
     
-    def test_ingest_csv_success(self, ingester, test_csv_file, sample_transactions_df):
-        """Test successful CSV ingestion."""
-        # Mock schema manager methods directly on the ingester
-        mock_schema_instance = Mock()
-        mock_schema_instance.auto_detect_schema.return_value = Mock(version="1.0.0")
-        mock_schema_instance.save_schema.return_value = None
-        
-        # Set the mocked schema manager
-        ingester._schema_manager = mock_schema_instance
-        
-        df, metadata = ingester.ingest_csv(str(test_csv_file), "test_transactions")
+    @pytest.fixture
+    def mocked_schema_manager(self, ingester):
+        """Schema manager mock attached to the ingester fixture."""
+        return ingester._schema_manager
+    
+    @pytest.mark.parametrize("method,file_fixture,sample_fixture,source_type", [
+        ("ingest_csv", "test_csv_file", "sample_transactions_df", "csv"),
+        ("ingest_json", "test_json_file", "sample_accounts_data", "json"),
+    ], ids=["csv", "json"])
+    def test_ingest_success(self, ingester, mocked_schema_manager, request,
+                            method, file_fixture, sample_fixture, source_type):
+        """Test successful CSV and JSON ingestion."""
+        path = request.getfixturevalue(file_fixture)
+        sample = request.getfixturevalue(sample_fixture)
+        
+        df, metadata = getattr(ingester, method)(str(path), f"test_{source_type}")
         
         # Verify DataFrame content
-        assert len(df) == len(sample_transactions_df)
-        assert list(df.columns[:7]) == list(sample_transactions_df.columns)
+        source_columns = list(pd.DataFrame(sample).columns)
+        assert len(df) == len(sample)
+        assert list(df.columns[:len(source_columns)]) == source_columns
         
         # Verify metadata columns were added
         assert '_ingestion_timestamp' in df.columns
@@ -71,59 +102,54 @@ class TestDataIngester:
         assert '_record_hash' in df.columns
         
         # Verify metadata
-        assert metadata['source_type'] == 'csv'
-        assert metadata['rows_ingested'] == len(sample_transactions_df)
+        assert metadata['source_type'] == source_type
+        assert metadata['rows_ingested'] == len(sample)
         assert 'processing_time' in metadata
         assert 'schema_version' in metadata
         
         # Verify schema methods were called
-        mock_schema_instance.auto_detect_schema.assert_called_once()
-        mock_schema_instance.save_schema.assert_called_once()
+        mocked_schema_manager.auto_detect_schema.assert_called_once()
+        mocked_schema_manager.save_schema.assert_called_once()
     
     def test_ingest_csv_file_not_found(self, ingester):
         """Test CSV ingestion with non-existent file."""
         with pytest.raises(FileNotFoundError):
-            ingester.ingest_csv("non_existent_file.csv", "test")
+            _single_attempt(ingester, 'ingest_csv')("non_existent_file.csv", "test")
     
-    def test_ingest_json_success(self, ingester, test_json_file, sample_accounts_data):
-        """Test successful JSON ingestion."""
-        # Mock schema manager methods directly on the ingester
-        mock_schema_instance = Mock()
-        mock_schema_instance.auto_detect_schema.return_value = Mock(version="1.0.0")
-        mock_schema_instance.save_schema.return_value = None
-        
-        # Set the mocked schema manager
-        ingester._schema_manager = mock_schema_instance
-        
-        df, metadata = ingester.ingest_json(str(test_json_file), "test_accounts")
-        
-        # Verify DataFrame content
-        assert len(df) == len(sample_accounts_data)
-        assert 'account_id' in df.columns
-        
-        # Verify metadata columns were added
-        assert '_ingestion_timestamp' in df.columns
-        assert '_source_file' in df.columns
-        assert '_record_hash' in df.columns
+    def test_ingest_json_invalid_format(self, ingester):
+        """Test JSON ingestion with invalid JSON format."""
+        # Serve the invalid content from memory instead of a file on disk
+        invalid_json = mock_open(read_data="invalid json content")
         
-        # Verify metadata
-        assert metadata['source_type'] == 'json'
-        assert metadata['rows_ingested'] == len(sample_accounts_data)
+        with patch('src.ingestion.ingest.open', invalid_json, create=True), \
+             pytest.raises(json.JSONDecodeError):
+            _single_attempt(ingester, 'ingest_json')("invalid.json", "test")
     
-    def test_ingest_json_invalid_format(self, ingester, temp_directory):
-        """Test JSON ingestion with invalid JSON format."""
-        invalid_json_file = temp_directory / "invalid.json"
-        with open(invalid_json_file, 'w') as f:
-            f.write("invalid json content")
+    def test_save_to_bronze_calls_parquet(self, ingester, sample_transactions_df):
+        """Test Bronze writes without serialising any data."""
+        # Touch the target so save_to_bronze can stat it without writing Parquet
+        with patch.object(pd.DataFrame, 'to_parquet', autospec=True,
+                          side_effect=lambda df, path, **kwargs: Path(path).touch()) as mock_to_parquet, \
+             patch('src.ingestion.ingest.open', mock_open(), create=True) as mock_file:
+            output_file = ingester.save_to_bronze(sample_transactions_df, "test_source", {'test': 'metadata'})
+        
+        mock_to_parquet.assert_called_once()
+        _, parquet_path = mock_to_parquet.call_args.args
+        assert parquet_path == output_file
+        assert output_file.suffix == '.parquet'
         
-        with pytest.raises(json.JSONDecodeError):
-            ingester.ingest_json(str(invalid_json_file), "test")
+        # Verify metadata was written next to the data file
+        metadata_path = mock_file.call_args.args[0]
+        assert metadata_path.name.endswith('_metadata.json')
+        assert metadata_path.parent == output_file.parent
+        assert mock_file().write.called
     
-    def test_save_to_bronze(self, ingester, sample_transactions_df, temp_directory):
+    @pytest.mark.slow
+    def test_save_to_bronze_roundtrip(self, ingester, sample_transactions_df, tmp_path):
         """Test saving data to Bronze layer."""
         # Set storage config directly to use temp directory
         ingester._storage_config = {
-            'bronze_path': str(temp_directory / 'bronze'),
+            'bronze_path': str(tmp_path / 'bronze'),
             'format': 'parquet'
         }
         
@@ -134,9 +160,8 @@ class TestDataIngester:
         assert output_file.exists()
         assert output_file.suffix == '.parquet'
         
-        # Verify data can be read back
-        df_read = pd.read_parquet(output_file)
-        assert len(df_read) == len(sample_transactions_df)
+        # Verify row count from the Parquet footer
+        assert pq.ParquetFile(output_file).metadata.num_rows == len(sample_transactions_df)
         
         # Verify metadata file was created
         metadata_files = list(output_file.parent.glob("*_metadata.json"))
@@ -163,10 +188,10 @@ class TestDataIngester:
                 assert metadata['simulated'] is True
                 mock_s3_method.assert_called_once()
     
-    def test_run_ingestion_pipeline_success(self, ingester, mock_config):
+    def test_run_ingestion_pipeline_success(self, ingester, ingest_config):
         """Test successful full ingestion pipeline run."""
         # Mock data sources
-        mock_config.get_data_sources.return_value = [
+        ingest_config.get_data_sources.return_value = [
             {
                 'name': 'test_transactions',
                 'type': 'csv',
@@ -199,10 +224,10 @@ class TestDataIngester:
             mock_ingest.assert_called_once()
             mock_save.assert_called_once()
     
-    def test_run_ingestion_pipeline_with_failure(self, ingester, mock_config):
+    def test_run_ingestion_pipeline_with_failure(self, ingester, ingest_config):
         """Test ingestion pipeline with source failure."""
         # Mock data sources
-        mock_config.get_data_sources.return_value = [
+        ingest_config.get_data_sources.return_value = [
             {
                 'name': 'failing_source',
                 'type': 'csv',
@@ -227,23 +252,23 @@ class TestDataIngester:
             assert source_result['status'] == 'failed'
             assert 'error' in source_result
     
-    def test_retry_mechanism(self, ingester, test_csv_file):
+    def test_retry_mechanism(self, ingester, sample_transactions_df):
         """Test retry mechanism for ingestion failures."""
-        # Mock schema manager methods directly on the ingester
-        mock_schema_instance = Mock()
-        mock_schema_instance.save_schema.return_value = None
-        
         # Mock schema detection to fail twice, then succeed
+        mock_schema_instance = ingester._schema_manager
         mock_schema_instance.auto_detect_schema.side_effect = [
             Exception("Network error"),
             Exception("Temporary failure"),
-            Mock(version="1.0.0")
+            _SCHEMA_V1
         ]
         
-        # Set the mocked schema manager
-        ingester._schema_manager = mock_schema_instance
+        # Keep the three attempts but skip the exponential back-off sleeps
+        ingest_csv = type(ingester).ingest_csv.retry_with(wait=wait_none())
         
-        df, metadata = ingester.ingest_csv(str(test_csv_file), "test_retry")
+        # read_csv runs inside the retried call, so serve one parsed frame
+        with patch('src.ingestion.ingest.pd.read_csv',
+                   return_value=sample_transactions_df.copy()) as mock_read_csv:
+            df, metadata = ingest_csv(ingester, "test_retry.csv", "test_retry")
         
         # Verify it eventually succeeded
         assert len(df) > 0
@@ -251,42 +276,29 @@ class TestDataIngester:
         
         # Verify retry attempts
         assert mock_schema_instance.auto_detect_schema.call_count == 3
+        assert mock_read_csv.call_count == 3
+
+
+@pytest.fixture(scope="session")
+def base_transactions_df(test_data_generator):
+    """Two generated transactions, enough to detect an added column."""
+    return test_data_generator.generate_transactions(2)
 
 
 class TestDataIngesterIntegration:
     """Integration tests for DataIngester."""
     
-    def _create_mocked_ingester(self):
-        """Helper method to create a mocked DataIngester instance."""
-        DataIngesterClass = _get_data_ingester()
-        if not INGESTION_AVAILABLE:
-            pytest.skip("DataIngester not available")
-            
-        # Mock schema manager methods
-        mock_schema_instance = Mock()
-        mock_schema_instance.auto_detect_schema.return_value = Mock(version="1.0.0")
-        mock_schema_instance.save_schema.return_value = None
-        
-        with patch('src.ingestion.ingest.PipelineMonitor') as mock_monitor:
-            mock_monitor.return_value = Mock()
-            
-            ingester = DataIngesterClass()
-            ingester._schema_manager = mock_schema_instance
-            return ingester
-    
     @pytest.mark.integration
-    def test_end_to_end_csv_ingestion(self, temp_directory, sample_transactions_df):
+    def test_end_to_end_csv_ingestion(self, ingester, tmp_path, sample_transactions_df,
+                                      sample_transactions_csv):
         """Test end-to-end CSV ingestion process."""
         # Create test files
-        csv_file = temp_directory / "transactions.csv"
-        sample_transactions_df.to_csv(csv_file, index=False)
-        
-        # Create mocked ingester
-        ingester = self._create_mocked_ingester()
+        csv_file = tmp_path / "transactions.csv"
+        shutil.copy(sample_transactions_csv, csv_file)
         
         # Override storage config to use temp directory
         ingester._storage_config = {
-            'bronze_path': str(temp_directory / 'bronze'),
+            'bronze_path': str(tmp_path / 'bronze'),
             'format': 'parquet'
         }
         
@@ -302,19 +314,21 @@ class TestDataIngesterIntegration:
         output_file = ingester.save_to_bronze(df, "integration_test", metadata)
         assert output_file.exists()
         
-        # Verify saved data
-        saved_df = pd.read_parquet(output_file)
-        assert len(saved_df) == len(df)
+        # Verify saved row count from the Parquet footer
+        assert pq.ParquetFile(output_file).metadata.num_rows == len(df)
     
     @pytest.mark.integration
-    def test_schema_evolution_detection(self, temp_directory, test_data_generator):
+    def test_schema_evolution_detection(self, ingester, tmp_path, base_transactions_df):
         """Test schema evolution detection."""
-        # Create mocked ingester
-        ingester = self._create_mocked_ingester()
+        # Each detection returns the next schema version
+        ingester._schema_manager.auto_detect_schema.side_effect = [
+            Mock(version="1.0.0"),
+            Mock(version="1.1.0")
+        ]
         
         # Create initial dataset (smaller for performance)
-        df1 = test_data_generator.generate_transactions(5)
-        csv_file1 = temp_directory / "transactions_v1.csv"
+        df1 = base_transactions_df
+        csv_file1 = tmp_path / "transactions_v1.csv"
         df1.to_csv(csv_file1, index=False)
         
         # Ingest first version
@@ -323,7 +337,7 @@ class TestDataIngesterIntegration:
         # Create evolved dataset (add new column)
         df2 = df1.copy()
         df2['new_column'] = 'new_value'
-        csv_file2 = temp_directory / "transactions_v2.csv"
+        csv_file2 = tmp_path / "transactions_v2.csv"
         df2.to_csv(csv_file2, index=False)
         
         # Ingest second version